@@ -92,6 +92,12 @@ DATABASES = {
         'PASSWORD': os.environ.get('DATABASE_PASSWORD', 'postgres'),
         'HOST': os.environ.get('DATABASE_HOST', 'localhost'),
         'PORT': os.environ.get('DATABASE_PORT', '5432'),
+        # Keep connections open between requests (seconds; 0 closes them
+        # after every request) instead of reconnecting and
+        # re-authenticating to PostgreSQL for each one
+        'CONN_MAX_AGE': int(os.environ.get('DATABASE_CONN_MAX_AGE', '60')),
+        # Check a reused connection is still alive before using it
+        'CONN_HEALTH_CHECKS': True,
     }
 }
 
@@ -132,6 +138,29 @@ STORAGES = {
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
+# ============================================================================
+# CACHE CONFIGURATION
+# ============================================================================
+# Used for cached API responses (see users/cache.py)
+# Set REDIS_URL (e.g. redis://host:6379/0) to share the cache between
+# workers/containers. Without it each process keeps its own in-memory
+# cache, which can't see other workers' invalidations, so API responses
+# are then not cached at all
+REDIS_URL = os.environ.get('REDIS_URL', '')
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
 # ============================================================================
 # REST FRAMEWORK CONFIGURATION
 # ============================================================================
@@ -139,6 +168,11 @@ REST_FRAMEWORK = {
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.AllowAny',
     ],
+    # JSON only in production; the browsable API (HTML pages rendered
+    # through the template engine) is enabled in development only
+    'DEFAULT_RENDERER_CLASSES': [
+        'users.renderers.ORJSONRenderer',  # Fast JSON encoding (orjson)
+    ] + (['rest_framework.renderers.BrowsableAPIRenderer'] if DEBUG else []),
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 10,
 }
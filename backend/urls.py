@@ -35,7 +35,7 @@ urlpatterns = [
     # Examples:
     # - http://localhost:8000/api/users/           (list/create users)
     # - http://localhost:8000/api/users/1/         (get/update/delete user)
-    # - http://localhost:8000/api/users/1/activate/ (custom action)
+    # - http://localhost:8000/api/users/active_users/ (custom action)
     path('api/', include('users.urls')),
     
     # Django REST Framework's browsable API authentication
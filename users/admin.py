@@ -23,38 +23,45 @@ class UserAdmin(admin.ModelAdmin):
     """
     
     # Fields to display in the list view
-    list_display = [
+    # Tuples rather than lists: these are fixed at class definition and
+    # iterated by the admin on every changelist request
+    list_display = (
         'id',
         'name',
         'email',
         'is_active',
-    ]
+    )
     
     # Fields that are clickable links to the detail page
-    list_display_links = ['id', 'name']
+    list_display_links = ('id', 'name')
     
     # Fields that can be edited directly in the list view
-    list_editable = ['is_active']
+    list_editable = ('is_active',)
     
     # Filters in the right sidebar
-    list_filter = [
+    list_filter = (
         'is_active',
-    ]
+    )
     
     # Search functionality
-    search_fields = [
+    search_fields = (
         'name',
         'email',
-    ]
+    )
     
     # Default ordering (by id)
-    ordering = ['id']
+    ordering = ('id',)
     
     # Number of items per page
     list_per_page = 25
     
+    # Join related objects in the changelist query
+    # User has no foreign keys today; this keeps future ones from turning
+    # the changelist into one query per row
+    list_select_related = True
+    
     # Read-only fields (cannot be edited)
-    readonly_fields = ['id']
+    readonly_fields = ('id',)
     
     # Group fields into sections
     # Note: Use either 'fields' OR 'fieldsets', not both
@@ -72,9 +79,10 @@ class UserAdmin(admin.ModelAdmin):
         Customize the queryset used in the admin.
         
         This method is called to get the list of objects to display.
+        Only the columns shown in list_display are selected.
         """
         queryset = super().get_queryset(request)
-        return queryset
+        return queryset.only(*self.list_display)
     
     def has_delete_permission(self, request, obj=None):
         """
@@ -0,0 +1,102 @@
+"""
+User Caching
+============
+Cache keys and helpers for cached user API responses.
+
+Responses are stored in Django's cache (see CACHES in settings.py). Every
+key embeds a shared "users version" stamp, so a single write invalidates
+all cached responses at once by changing the stamp; old entries are never
+read again and simply expire.
+
+Model saves and deletes invalidate through the signal handlers in
+users/signals.py; code that bypasses signals (QuerySet.update(),
+bulk_create()) calls invalidate_user_caches() itself.
+
+Invalidation only works if every process sees the same version stamp, so
+responses are only cached when the cache is shared between processes
+(e.g. Redis via REDIS_URL). With the per-process LocMemCache fallback,
+a write handled by one gunicorn worker would leave the others serving
+stale responses, so get_response_cache() disables caching instead.
+"""
+
+import hashlib
+import time
+
+from django.core.cache import cache, caches  # type: ignore
+from django.core.cache.backends.dummy import DummyCache  # type: ignore
+from django.core.cache.backends.locmem import LocMemCache  # type: ignore
+
+# Cache key holding the current users version stamp
+USERS_VERSION_KEY = 'users:version'
+
+# Stands in for the cache when it isn't shared: stores nothing, so every
+# get() misses and get_or_set() always computes the value
+_NO_CACHE = DummyCache('users', {})
+
+# How long (seconds) a cached active_users response may be served
+ACTIVE_USERS_CACHE_TIMEOUT = 60
+
+# How long (seconds) a cached page of the user list may be served
+USER_LIST_CACHE_TIMEOUT = 30
+
+
+def get_response_cache():
+    """
+    Return the cache to store user responses in.
+    
+    Returns:
+    --------
+    BaseCache: The default cache if it is shared between processes,
+        otherwise a cache that stores nothing (see the module docstring)
+    """
+    backend = caches['default']
+    if isinstance(backend, LocMemCache):
+        return _NO_CACHE
+    return backend
+
+
+def get_users_version():
+    """
+    Return the current users version stamp, creating it if needed.
+    
+    A fresh stamp is time-based rather than restarting at 1, so keys
+    from before an eviction of the stamp can't be reused.
+    
+    Returns:
+    --------
+    int: The current version stamp
+    """
+    version = cache.get(USERS_VERSION_KEY)
+    if version is None:
+        cache.add(USERS_VERSION_KEY, time.time_ns(), None)
+        version = cache.get(USERS_VERSION_KEY)
+    return version
+
+
+def user_cache_key(name, *parts):
+    """
+    Build a cache key for a cached user response.
+    
+    Parameters:
+    -----------
+    name : str
+        What is cached, e.g. 'active'
+    *parts : str
+        Anything the response depends on, e.g. the full request URL
+    
+    Returns:
+    --------
+    str: e.g. 'users:active:v1697000000000000000:3f2a...'
+    """
+    digest = hashlib.sha1('|'.join(parts).encode()).hexdigest()
+    return f"users:{name}:v{get_users_version()}:{digest}"
+
+
+def invalidate_user_caches():
+    """
+    Invalidate every cached user response.
+    
+    Call this after writing to the users table without going through
+    User.save()/User.delete() (which trigger it via signals).
+    """
+    cache.set(USERS_VERSION_KEY, time.time_ns(), None)
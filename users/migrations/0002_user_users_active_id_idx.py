@@ -0,0 +1,21 @@
+# Generated by Django 4.2.7 on 2026-10-15 10:02
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    # CREATE INDEX CONCURRENTLY can't run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ('users', '0001_initial'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='user',
+            index=models.Index(fields=['is_active', 'id'], name='users_active_id_idx'),
+        ),
+    ]
@@ -0,0 +1,64 @@
+# Generated by Django 4.2.7 on 2026-10-15 10:41
+
+from django.db import migrations, models
+from django.db.models import Count
+from django.db.models.functions import Lower
+
+
+def lowercase_emails(apps, schema_editor):
+    """
+    Lowercase every stored email in a single UPDATE.
+    
+    Only rows that aren't already lowercase are touched. If two users'
+    emails differ only by case, lowercasing would violate users_email_key,
+    so the migration stops first and lists them; merge or rename those
+    users, then run migrate again.
+    """
+    User = apps.get_model('users', 'User')
+    
+    duplicates = list(
+        User.objects.annotate(email_lower=Lower('email'))
+        .values('email_lower')
+        .annotate(count=Count('id'))
+        .filter(count__gt=1)
+        .order_by('email_lower')[:20]
+    )
+    if duplicates:
+        raise RuntimeError(
+            "Cannot make emails case-insensitively unique: these emails are "
+            "used by more than one user when lowercased: "
+            + ", ".join(row['email_lower'] for row in duplicates)
+            + ". Merge or rename those users, then run migrate again."
+        )
+    
+    User.objects.exclude(email=Lower('email')).update(email=Lower('email'))
+
+
+class Migration(migrations.Migration):
+
+    # CREATE INDEX CONCURRENTLY can't run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ('users', '0002_user_users_active_id_idx'),
+    ]
+
+    operations = [
+        migrations.RunPython(lowercase_emails, migrations.RunPython.noop),
+        # Build the unique index without blocking writes; the state gets
+        # the equivalent UniqueConstraint (which Django creates as this index)
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunSQL(
+                    'CREATE UNIQUE INDEX CONCURRENTLY "users_email_lower_uniq" ON "users" ((LOWER("email")))',
+                    reverse_sql='DROP INDEX CONCURRENTLY IF EXISTS "users_email_lower_uniq"',
+                ),
+            ],
+            state_operations=[
+                migrations.AddConstraint(
+                    model_name='user',
+                    constraint=models.UniqueConstraint(Lower('email'), name='users_email_lower_uniq'),
+                ),
+            ],
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 4.2.7 on 2026-10-15 11:08
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0003_lowercase_emails_user_users_email_lower_uniq'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now, help_text='When this user was last modified.'),
+            preserve_default=False,
+        ),
+        # The users table is also written outside Django (managed = False);
+        # give the column a database default so those INSERTs still work
+        migrations.RunSQL(
+            'ALTER TABLE users ALTER COLUMN updated_at SET DEFAULT now()',
+            reverse_sql='ALTER TABLE users ALTER COLUMN updated_at DROP DEFAULT',
+        ),
+    ]
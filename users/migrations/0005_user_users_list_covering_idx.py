@@ -0,0 +1,21 @@
+# Generated by Django 4.2.7 on 2026-10-15 11:52
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    # CREATE INDEX CONCURRENTLY can't run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ('users', '0004_user_updated_at'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='user',
+            index=models.Index(fields=['id'], include=('name', 'email', 'is_active'), name='users_list_covering_idx'),
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 4.2.7 on 2026-10-15 12:21
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import AddIndexConcurrently, TrigramExtension
+from django.db import migrations, models
+import django.db.models.functions.comparison
+import django.db.models.functions.text
+
+
+class Migration(migrations.Migration):
+
+    # CREATE INDEX CONCURRENTLY can't run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ('users', '0005_user_users_list_covering_idx'),
+    ]
+
+    operations = [
+        # gin_trgm_ops comes from the pg_trgm extension
+        TrigramExtension(),
+        AddIndexConcurrently(
+            model_name='user',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper(django.db.models.functions.comparison.Cast('name', models.TextField())), name='gin_trgm_ops'), name='users_name_upper_trgm_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='user',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper(django.db.models.functions.comparison.Cast('email', models.TextField())), name='gin_trgm_ops'), name='users_email_upper_trgm_idx'),
+        ),
+    ]
@@ -8,7 +8,118 @@ The model uses Django's ORM (Object-Relational Mapping) to interact with
 the database without writing raw SQL queries.
 """
 
-from django.db import models  # type: ignore
+from django.contrib.postgres.indexes import GinIndex, OpClass  # type: ignore
+from django.core.exceptions import ValidationError  # type: ignore
+from django.db import connections, models, router  # type: ignore
+from django.db.models.functions import Cast, Lower, Upper  # type: ignore
+from django.utils import timezone  # type: ignore
+
+
+class UserManager(models.Manager):
+    """
+    User Manager
+    ============
+    The default manager (User.objects), with single-query write methods.
+    """
+    
+    def update_returning(self, pk, **values):
+        """
+        Update one user and return the updated row, in a single query.
+        
+        Runs UPDATE users SET ... WHERE id = pk RETURNING *, instead of
+        loading the user (SELECT) and then saving it (UPDATE). The ORM's
+        QuerySet.update() can't return rows, hence the hand-built SQL.
+        
+        Like QuerySet.update(), this skips save() and its signals, so
+        values must already be normalized (the serializer does this).
+        updated_at is always set.
+        
+        Parameters:
+        -----------
+        pk : int or str
+            The user's id (e.g. from the URL)
+        **values : Any
+            Field name -> new value
+        
+        Returns:
+        --------
+        User: The updated user, or None if no user has this id
+        """
+        meta = self.model._meta
+        try:
+            pk = meta.pk.to_python(pk)
+        except ValidationError:
+            return None  # Not a valid id, so no such user
+        
+        connection = connections[router.db_for_write(self.model)]
+        quote = connection.ops.quote_name
+        
+        values = {**values, 'updated_at': timezone.now()}
+        fields = [meta.get_field(name) for name in values]
+        columns = meta.concrete_fields
+        
+        sql = 'UPDATE {table} SET {assignments} WHERE {pk} = %s RETURNING {columns}'.format(
+            table=quote(meta.db_table),
+            assignments=', '.join(f'{quote(field.column)} = %s' for field in fields),
+            pk=quote(meta.pk.column),
+            columns=', '.join(quote(field.column) for field in columns),
+        )
+        params = [field.get_db_prep_save(values[field.name], connection) for field in fields]
+        params.append(pk)
+        
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            row = cursor.fetchone()
+        
+        if row is None:
+            return None
+        
+        # Convert the raw column values as a normal query would (e.g. make
+        # datetimes timezone-aware on backends that return naive ones)
+        values = []
+        for field, value in zip(columns, row):
+            col = field.get_col(meta.db_table)
+            for converter in connection.ops.get_db_converters(col) + col.get_db_converters(connection):
+                value = converter(value, col, connection)
+            values.append(value)
+        return self.model.from_db(connection.alias, [field.attname for field in columns], values)
+    
+    def delete_by_pk(self, pk):
+        """
+        Delete one user with a single DELETE query.
+        
+        Model.delete() and QuerySet.delete() go through Django's deletion
+        collector, which loads the rows, looks for related objects and
+        wraps the DELETE in a transaction. User has no relations, so a
+        plain DELETE ... WHERE id = pk is equivalent.
+        
+        Like QuerySet.update(), this skips delete() and its signals.
+        
+        Parameters:
+        -----------
+        pk : int or str
+            The user's id (e.g. from the URL)
+        
+        Returns:
+        --------
+        int: Number of users deleted (0 if no user has this id)
+        """
+        meta = self.model._meta
+        try:
+            pk = meta.pk.to_python(pk)
+        except ValidationError:
+            return 0  # Not a valid id, so no such user
+        
+        connection = connections[router.db_for_write(self.model)]
+        quote = connection.ops.quote_name
+        
+        sql = 'DELETE FROM {table} WHERE {pk} = %s'.format(
+            table=quote(meta.db_table),
+            pk=quote(meta.pk.column),
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [pk])
+            return cursor.rowcount
 
 
 class User(models.Model):
@@ -22,7 +133,9 @@ class User(models.Model):
     -------
     - id: Primary key (auto-generated)
     - name: User's name
-    - email: User's email address (unique)
+    - email: User's email address (unique, case-insensitively)
+    - is_active: Whether the user is active
+    - updated_at: When the user was last modified (set automatically)
     
     Meta:
     -----
@@ -31,6 +144,10 @@ class User(models.Model):
                        (since it already exists in your database)
     """
     
+    # Default manager, with update_returning()/delete_by_pk() for
+    # single-query writes
+    objects = UserManager()
+    
     # Primary key field (auto-incrementing integer)
     # If your existing table has 'id', Django will use it automatically
     id = models.AutoField(primary_key=True)
@@ -57,6 +174,16 @@ class User(models.Model):
         help_text="Whether this user is active."
     )
     
+    # Last-modified timestamp - used to build ETags for conditional GETs
+    # auto_now=True: set to the current time on every save()
+    # (QuerySet.update() bypasses auto_now, so bulk updates must set it)
+    # (the column defaults to now() in the database, for INSERTs made
+    # outside Django; see migration 0004)
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        help_text="When this user was last modified."
+    )
+    
     class Meta:
         """
         Model Metadata
@@ -72,8 +199,42 @@ class User(models.Model):
         managed = False
         
         # Default ordering for queries (by id)
+        # Views rely on this instead of calling order_by('id') themselves
         ordering = ['id']
         
+        # Indexes (created by migrations in users/migrations/)
+        # (is_active, id): serves filtering by is_active with id ordering,
+        # as used by the admin changelist filter and ?is_active= queries,
+        # without a sort step
+        # id INCLUDE (name, email, is_active): covers every column the list
+        # endpoint reads, so a page is an index-only scan in id order
+        # Trigram GIN on UPPER(name::text) / UPPER(email::text): the exact
+        # expressions PostgreSQL icontains compares against, so ?search=
+        # (name/email icontains) is an index lookup instead of a full scan
+        indexes = [
+            models.Index(fields=['is_active', 'id'], name='users_active_id_idx'),
+            models.Index(
+                fields=['id'],
+                include=['name', 'email', 'is_active'],
+                name='users_list_covering_idx',
+            ),
+            GinIndex(
+                OpClass(Upper(Cast('name', models.TextField())), name='gin_trgm_ops'),
+                name='users_name_upper_trgm_idx',
+            ),
+            GinIndex(
+                OpClass(Upper(Cast('email', models.TextField())), name='gin_trgm_ops'),
+                name='users_email_upper_trgm_idx',
+            ),
+        ]
+        
+        # Constraints (created by migrations in users/migrations/)
+        # Unique index on LOWER(email): emails are unique regardless of case,
+        # even for rows written outside Django (e.g. raw SQL)
+        constraints = [
+            models.UniqueConstraint(Lower('email'), name='users_email_lower_uniq'),
+        ]
+        
         # Human-readable names for the model
         verbose_name = 'User'
         verbose_name_plural = 'Users'
@@ -89,20 +250,66 @@ class User(models.Model):
         """
         return self.name
     
+    def normalize(self):
+        """
+        Normalize field values before they are written to the database.
+        
+        Shared by save() and by bulk inserts (bulk_create skips save()).
+        
+        Returns:
+        --------
+        set: Names of the fields whose values were changed
+        """
+        normalized = set()
+        
+        # Convert email to lowercase (only if needed), so stored emails are
+        # always lowercase and can be looked up by plain equality on the
+        # email column's own unique index
+        email = self.email.lower() if self.email else self.email
+        if email != self.email:
+            self.email = email
+            normalized.add('email')
+        
+        # Trim whitespace from name (only if needed)
+        name = self.name.strip() if self.name else self.name
+        if name != self.name:
+            self.name = name
+            normalized.add('name')
+        
+        return normalized
+    
     def save(self, *args, **kwargs):
         """
         Override the save method to add custom logic before saving.
         
         This is called every time a User object is saved to the database.
         You can add validation or data transformation here.
+        
+        When called with update_fields, any field changed by normalize()
+        is added to it, along with updated_at, so the UPDATE stays limited
+        to those columns but never drops a normalized value or a timestamp.
+        
+        An instance loaded with deferred fields (e.g. .only() in the admin)
+        is saved the same way: Django would otherwise write only the loaded
+        columns, leaving updated_at (and so ETags) unchanged.
+        
+        save(update_fields=[]) stays a no-op, as in Django, unless
+        normalize() changed a field.
         """
-        # Convert email to lowercase for consistency
-        if self.email:
-            self.email = self.email.lower()
+        normalized = self.normalize()
         
-        # Trim whitespace from name
-        if self.name:
-            self.name = self.name.strip()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and not update_fields and not normalized:
+            return
+        if update_fields is None and not self._state.adding:
+            deferred = self.get_deferred_fields()
+            if deferred:
+                update_fields = [
+                    field.attname for field in self._meta.concrete_fields  # type: ignore
+                    if not field.primary_key and field.attname not in deferred
+                ]
+        if update_fields is not None:
+            kwargs['update_fields'] = set(update_fields) | normalized | {'updated_at'}
         
         # Call the parent class's save method to actually save to database
         super().save(*args, **kwargs)
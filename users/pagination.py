@@ -0,0 +1,267 @@
+"""
+User Pagination
+===============
+Pagination splits large lists of users into pages.
+
+DRF's PageNumberPagination runs SELECT COUNT(*) on every list request to
+report the total and build next/previous links. On a large users table
+that count costs more than fetching the page itself, so this module
+caches it for a short time, and for large unfiltered lists uses
+PostgreSQL's row estimate instead of counting at all.
+
+Page numbers become LIMIT/OFFSET queries, which get slower the deeper the
+page (the database still walks every skipped row). So "next" links use
+keyset ("seek") pagination instead: ?after=<last id> becomes
+WHERE id > <last id> ORDER BY id LIMIT n, which costs the same at any
+depth thanks to the primary key index.
+"""
+
+from collections import OrderedDict
+
+from django.core.paginator import InvalidPage, Paginator  # type: ignore
+from django.db import connections, models, router  # type: ignore
+from django.utils.functional import cached_property  # type: ignore
+from rest_framework.exceptions import NotFound  # type: ignore
+from rest_framework.pagination import PageNumberPagination  # type: ignore
+from rest_framework.response import Response  # type: ignore
+from rest_framework.utils.urls import remove_query_param, replace_query_param  # type: ignore
+
+from .cache import get_response_cache, user_cache_key
+
+
+def estimate_row_count(model):
+    """
+    Return PostgreSQL's estimate of the number of rows in a model's table.
+    
+    Reads pg_class.reltuples, which VACUUM/ANALYZE (and autovacuum) keep
+    up to date. This is a catalog lookup, not a scan, so it costs the same
+    for any table size, but it is only approximate.
+    
+    Parameters:
+    -----------
+    model : Model class
+        The model whose table to estimate
+    
+    Returns:
+    --------
+    int: The estimated row count, or -1 if unknown (other databases, or a
+        table that has never been analyzed)
+    """
+    connection = connections[router.db_for_read(model)]
+    if connection.vendor != 'postgresql':
+        return -1
+    
+    with connection.cursor() as cursor:
+        cursor.execute(
+            'SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass',
+            [connection.ops.quote_name(model._meta.db_table)],
+        )
+        row = cursor.fetchone()
+    return row[0] if row else -1
+
+
+class CachedCountPaginator(Paginator):
+    """
+    Django Paginator whose total count is cached (or estimated).
+    
+    The count is cached per query (the SQL, including filter values), so
+    each filter/search combination gets its own entry. Entries are
+    invalidated with the other user caches whenever a user is written.
+    Counts are only cached with a shared cache (see users/cache.py).
+    
+    For an unfiltered list of at least `estimate_threshold` rows, the count
+    is PostgreSQL's row estimate instead: exact totals don't matter at that
+    size, and COUNT(*) would have to visit every row. The estimate is cached
+    under the same key, so a cache hit costs no query at all.
+    
+    A caller that has already counted the rows (UserViewSet.list() gets the
+    count from its ETag query) passes it as `known_count`, and no count
+    query, cache lookup or estimate happens at all.
+    """
+    
+    # How long (seconds) a count is reused
+    count_cache_timeout = 30
+    
+    # Unfiltered tables at least this large report an estimated count
+    estimate_threshold = 100000
+    
+    def __init__(self, object_list, per_page, *args, known_count=None, **kwargs):
+        super().__init__(object_list, per_page, *args, **kwargs)
+        self.known_count = known_count
+    
+    @cached_property
+    def count(self):
+        """
+        Return the total number of objects, from the cache if possible.
+        
+        Returns:
+        --------
+        int: Total number of objects across all pages (approximate for
+            large unfiltered lists)
+        """
+        if self.known_count is not None:
+            return self.known_count
+        
+        query = self.object_list.query
+        response_cache = get_response_cache()
+        key = user_cache_key('count', str(query))
+        count = response_cache.get(key)
+        if count is not None:
+            return count
+        
+        if not query.where:
+            estimate = estimate_row_count(query.model)
+            if estimate >= self.estimate_threshold:
+                count = estimate
+        if count is None:
+            count = self.object_list.count()
+        
+        response_cache.set(key, count, self.count_cache_timeout)
+        return count
+
+
+def get_row_id(row):
+    """
+    Return the id of a paginated row.
+    
+    Parameters:
+    -----------
+    row : User or tuple
+        A model instance, or a values_list() row starting with the id
+        (as UserViewSet.list_fields does)
+    
+    Returns:
+    --------
+    int: The user's id
+    """
+    if isinstance(row, models.Model):
+        return row.pk
+    return row[0]
+
+
+class UserPagination(PageNumberPagination):
+    """
+    Page number pagination for users, with a cached total count and
+    keyset "next" links.
+    
+    Response format is unchanged: {"count", "next", "previous", "results"}.
+    Page size comes from REST_FRAMEWORK['PAGE_SIZE'].
+    
+    ?page=N still works. "next" links point to ?after=<last id on this
+    page>, which fetches the following page by id instead of by offset.
+    Pages reached with ?after= have no "previous" link.
+    
+    The queryset must be ordered by id (User.Meta.ordering).
+    """
+    
+    django_paginator_class = CachedCountPaginator
+    
+    # Query parameter holding the last id of the previous page
+    after_query_param = 'after'
+    
+    def paginate_queryset(self, queryset, request, view=None, count=None):
+        """
+        Return one page of `queryset`, by page number or by ?after= id.
+        
+        Parameters:
+        -----------
+        queryset : QuerySet
+            The filtered queryset, ordered by id
+        request : Request
+            The current request
+        view : APIView
+            The view being paginated
+        count : int, optional
+            The number of rows in `queryset`, if the caller already knows
+            it (saves the count query)
+        
+        Returns:
+        --------
+        list: The rows of the requested page (None if pagination is off)
+        
+        Raises:
+        -------
+        NotFound: If ?after= is not an integer, or the page doesn't exist
+        """
+        page_size: int = self.get_page_size(request)  # type: ignore
+        if not page_size:
+            return None
+        
+        self.request = request
+        paginator = self.django_paginator_class(queryset, page_size, known_count=count)
+        
+        after = request.query_params.get(self.after_query_param)
+        self.after = None
+        if after is None:
+            # Same as PageNumberPagination.paginate_queryset(), except for
+            # passing the known count to the paginator
+            page_number = self.get_page_number(request, paginator)
+            try:
+                self.page = paginator.page(page_number)
+            except InvalidPage as exc:
+                raise NotFound(self.invalid_page_message.format(  # type: ignore
+                    page_number=page_number, message=str(exc)
+                ))
+            
+            if paginator.num_pages > 1 and self.template is not None:  # type: ignore
+                # The browsable API should display pagination controls
+                self.display_page_controls = True
+            
+            return list(self.page)
+        
+        try:
+            self.after = int(after)
+        except ValueError:
+            raise NotFound('Invalid cursor.')
+        
+        # Same (cached) total as page-number requests
+        self.count = paginator.count
+        
+        # Fetch one extra row to learn whether there is a next page
+        rows = list(queryset.filter(id__gt=self.after)[:page_size + 1])
+        self.has_next = len(rows) > page_size
+        self.rows = rows[:page_size]
+        return self.rows
+    
+    def get_paginated_response(self, data):
+        """
+        Wrap a page of serialized users with count and links.
+        
+        Parameters:
+        -----------
+        data : list
+            The serialized page
+        
+        Returns:
+        --------
+        Response: {"count", "next", "previous", "results"}
+        """
+        if self.after is None:
+            return super().get_paginated_response(data)
+        
+        return Response(OrderedDict([
+            ('count', self.count),
+            ('next', self.get_next_link()),
+            ('previous', None),
+            ('results', data),
+        ]))
+    
+    def get_next_link(self):
+        """
+        Build the keyset link to the next page, if there is one.
+        
+        Returns:
+        --------
+        str: URL with ?after=<last id on this page>, or None
+        """
+        if self.after is None:
+            if not self.page.has_next():
+                return None
+            last_id = get_row_id(self.page.object_list[-1])
+        else:
+            if not self.has_next:
+                return None
+            last_id = get_row_id(self.rows[-1])
+        
+        url = remove_query_param(self.request.build_absolute_uri(), self.page_query_param)
+        return replace_query_param(url, self.after_query_param, last_id)
@@ -0,0 +1,59 @@
+"""
+User Renderers
+==============
+Renderers turn the Python data returned by views (dicts, lists) into the
+bytes sent in the HTTP response.
+
+This module provides a JSON renderer backed by orjson, a C JSON library
+that encodes large list responses several times faster than the standard
+library json module used by DRF's default JSONRenderer.
+"""
+
+import orjson  # type: ignore
+from rest_framework.renderers import JSONRenderer  # type: ignore
+from rest_framework.utils.encoders import JSONEncoder  # type: ignore
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    orjson JSON Renderer
+    ====================
+    Drop-in replacement for DRF's JSONRenderer (same media type and
+    format) that encodes with orjson.
+    
+    orjson natively handles dicts, lists, strings, numbers, datetimes and
+    UUIDs. Anything else (lazy translation strings, Decimals, ...) is
+    passed to DRF's JSONEncoder.default so output matches JSONRenderer.
+    """
+    
+    # Fallback for types orjson doesn't serialize natively
+    default = staticmethod(JSONEncoder().default)
+    
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """
+        Render `data` into JSON bytes.
+        
+        Parameters:
+        -----------
+        data : Any
+            The response data (usually serializer.data)
+        accepted_media_type : str
+            The negotiated media type, may carry an indent parameter
+        renderer_context : dict
+            Extra context from the view (may request indentation)
+        
+        Returns:
+        --------
+        bytes: The JSON-encoded response body
+        """
+        if data is None:
+            return b''
+        
+        option = orjson.OPT_NON_STR_KEYS
+        
+        # orjson only supports 2-space indentation; use it whenever the
+        # client (or the browsable API) asks for indented output
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            option |= orjson.OPT_INDENT_2
+        
+        return orjson.dumps(data, default=self.default, option=option)
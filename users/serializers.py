@@ -11,11 +11,180 @@ Think of serializers as translators between:
 - Database models (Python objects) ←→ JSON (API data)
 """
 
+import copy
+from typing import TYPE_CHECKING
+
+from django.db import IntegrityError, transaction  # type: ignore
 from rest_framework import serializers  # type: ignore
+from .cache import invalidate_user_caches
 from .models import User
 
+if TYPE_CHECKING:
+    # Lets type checkers see the serializer methods the mixin relies on
+    _SerializerBase = serializers.ModelSerializer
+else:
+    _SerializerBase = object
+
+
+def raise_for_integrity_error(error):
+    """
+    Translate a unique-constraint violation into a validation error.
+    
+    Uniqueness is enforced by the database rather than checked with a
+    query before every write, so a duplicate email surfaces here as an
+    IntegrityError from INSERT/UPDATE. Callers run the write in its own
+    transaction.atomic() block, so inside an outer transaction (tests,
+    ATOMIC_REQUESTS) only that savepoint is rolled back and later queries
+    still work.
+    
+    Parameters:
+    -----------
+    error : IntegrityError
+        The error raised by the database
+    
+    Raises:
+    -------
+    serializers.ValidationError: If the error is a duplicate email
+    IntegrityError: Re-raised unchanged for any other constraint
+    """
+    # psycopg2 exposes the violated constraint name (e.g. users_email_key);
+    # fall back to the message text for other backends
+    diag = getattr(error.__cause__, 'diag', None)
+    constraint = getattr(diag, 'constraint_name', None) or str(error)
+    
+    if 'email' in constraint:
+        raise serializers.ValidationError({
+            'email': ["A user with this email already exists."]
+        }) from error
+    raise error
+
+
+class CachedFieldsMixin(_SerializerBase):
+    """
+    Build a serializer's fields once per class instead of once per instance.
+    
+    ModelSerializer.get_fields() introspects the model and builds every
+    field (with its validators) each time a serializer is created, i.e.
+    on every request. The result only depends on the class, so it is
+    built once and each new serializer gets a deep copy, which the
+    serializer then binds as usual.
+    
+    Must come before the serializer base class:
+        class MySerializer(CachedFieldsMixin, serializers.ModelSerializer)
+    """
+    
+    # Each serializer class's unbound fields, set on first use
+    _cached_fields: dict | None = None
+    
+    def get_fields(self):
+        """
+        Return a fresh copy of the class's (cached) unbound fields.
+        
+        Returns:
+        --------
+        dict: Field name -> unbound Field instance
+        """
+        cls = type(self)
+        # Look in the class's own __dict__ so subclasses get their own cache
+        fields = cls.__dict__.get('_cached_fields')
+        if fields is None:
+            fields = super().get_fields()
+            cls._cached_fields = fields
+        return copy.deepcopy(fields)
+
+
+class UserListCreateSerializer(serializers.ListSerializer):
+    """
+    Batch Create Serializer
+    =======================
+    Used automatically by UserSerializer when it is instantiated with
+    many=True (e.g. POST /api/users/ with a JSON list).
+    
+    Inserts all users with bulk_create in batches instead of one
+    INSERT per row.
+    """
+    
+    # Maximum number of rows per INSERT statement
+    batch_size = 1000
+    
+    def to_internal_value(self, data):
+        """
+        Validate every item, then check the batch's emails for duplicates.
+        
+        All emails are checked against the database with a single IN query
+        (rather than one query per user), and against each other, so each
+        rejected item gets its own error instead of failing the whole
+        INSERT.
+        
+        Parameters:
+        -----------
+        data : list
+            The list of user objects from the request
+        
+        Returns:
+        --------
+        list: The validated data dicts
+        
+        Raises:
+        -------
+        serializers.ValidationError: With one error dict per item
+        """
+        validated_data = super().to_internal_value(data)
+        
+        # Emails are lowercased by validate_email, and stored emails are
+        # always lowercase (User.normalize), so a plain IN on the email
+        # column matches case-insensitively via its unique index
+        emails = [attrs['email'] for attrs in validated_data]
+        taken = set(
+            User.objects.filter(email__in=emails)
+            .order_by()
+            .values_list('email', flat=True)
+        )
+        
+        errors = []
+        for email in emails:
+            if email in taken:
+                errors.append({'email': ["A user with this email already exists."]})
+            else:
+                errors.append({})
+            taken.add(email)  # Later duplicates within the batch are errors too
+        
+        if any(errors):
+            raise serializers.ValidationError(errors)
+        
+        return validated_data
+    
+    def create(self, validated_data):
+        """
+        Create and return a list of new User instances.
+        
+        Parameters:
+        -----------
+        validated_data : list
+            List of validated data dicts, one per user
+        
+        Returns:
+        --------
+        list: The newly created User instances
+        """
+        users = [User(**attrs) for attrs in validated_data]
+        
+        # bulk_create doesn't call save(), so normalize each user here
+        for user in users:
+            user.normalize()
+        
+        try:
+            with transaction.atomic():  # type: ignore
+                users = User.objects.bulk_create(users, batch_size=self.batch_size)
+        except IntegrityError as error:
+            raise_for_integrity_error(error)
+        
+        # bulk_create doesn't send post_save, so drop cached responses here
+        invalidate_user_caches()
+        return users
+
 
-class UserSerializer(serializers.ModelSerializer):
+class UserSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     User Serializer
     ===============
@@ -27,11 +196,38 @@ class UserSerializer(serializers.ModelSerializer):
     3. Provides automatic validation based on model field definitions
     
     ModelSerializer automatically:
-    - Creates fields based on the model
+    - Creates fields based on the model (built once per class, see
+      CachedFieldsMixin)
     - Implements create() and update() methods
     - Provides default validation
+    
+    Writable fields are declared explicitly below, so DRF doesn't have to
+    build them from the model (and merge extra_kwargs) for each serializer.
     """
     
+    # Email - mandatory, cannot be empty
+    # No UniqueValidator: uniqueness is enforced by the database's unique
+    # index instead of a query (see raise_for_integrity_error)
+    email = serializers.EmailField(
+        max_length=254,
+        required=True,
+        allow_blank=False,
+    )
+    
+    # Name - mandatory, 1 to 255 characters
+    name = serializers.CharField(
+        min_length=1,
+        max_length=255,
+        required=True,
+        allow_blank=False,
+    )
+    
+    # Active status - optional, defaults to active
+    is_active = serializers.BooleanField(
+        required=False,
+        default=True,  # type: ignore
+    )
+    
     class Meta:
         """
         Serializer Metadata
@@ -42,34 +238,16 @@ class UserSerializer(serializers.ModelSerializer):
         model = User
         
         # Fields to include in the serialized output
-        # Using '__all__' to include all model fields (id, name, email, is_active)
-        fields = '__all__'
-        
-        # Alternatively, specify fields explicitly:
-        # fields = ['id', 'name', 'email', 'is_active']
+        # Listed explicitly (rather than '__all__') to keep the model's field
+        # order, since some fields are declared on the serializer
+        fields = ['id', 'name', 'email', 'is_active', 'updated_at']
         
         # Read-only fields - cannot be modified through the API
         # ID is automatically set by the database
         read_only_fields = ['id']
         
-        # Extra keyword arguments for fields
-        # Provides additional validation and behavior
-        extra_kwargs = {
-            'email': {
-                'required': True,  # Email is mandatory
-                'allow_blank': False,  # Cannot be empty string
-            },
-            'name': {
-                'required': True,  # Name is mandatory
-                'allow_blank': False,  # Cannot be empty string
-                'min_length': 1,  # Minimum 1 character
-                'max_length': 255,  # Maximum 255 characters
-            },
-            'is_active': {
-                'required': False,  # Optional field
-                'default': True,  # Defaults to active
-            },
-        }
+        # Serializer used for many=True (batch create)
+        list_serializer_class = UserListCreateSerializer
     
     def validate_email(self, value):
         """
@@ -92,23 +270,8 @@ class UserSerializer(serializers.ModelSerializer):
         serializers.ValidationError: If validation fails
         """
         # Convert email to lowercase for consistency
-        value = value.lower()
-        
-        # Check if email already exists (for create operations)
-        # self.instance is None for create, and the existing object for update
-        if self.instance is None:  # Creating new user
-            if User.objects.filter(email=value).exists():
-                raise serializers.ValidationError(
-                    "A user with this email already exists."
-                )
-        else:  # Updating existing user
-            # Check if another user has this email
-            if User.objects.filter(email=value).exclude(id=self.instance.id).exists():
-                raise serializers.ValidationError(
-                    "A user with this email already exists."
-                )
-        
-        return value
+        # Uniqueness is enforced by the database on save, so no query runs here
+        return value.lower()
     
     def validate_name(self, value):
         """
@@ -159,8 +322,8 @@ class UserSerializer(serializers.ModelSerializer):
         serializers.ValidationError: If validation fails
         """
         # Example: You could add cross-field validation here
-        # For instance, checking if first_name and last_name are both provided
-        # or neither is provided
+        # Email uniqueness is not checked here; a duplicate is rejected by
+        # the database and reported by create()/update()
         
         return data
     
@@ -182,7 +345,12 @@ class UserSerializer(serializers.ModelSerializer):
         User: The newly created User instance
         """
         # Create and return a new user instance
-        user = User.objects.create(**validated_data)
+        # A duplicate email is rejected by the unique index and becomes a 400
+        try:
+            with transaction.atomic():  # type: ignore
+                user = User.objects.create(**validated_data)
+        except IntegrityError as error:
+            raise_for_integrity_error(error)
         return user
     
     def update(self, instance, validated_data):
@@ -202,30 +370,141 @@ class UserSerializer(serializers.ModelSerializer):
         --------
         User: The updated User instance
         """
-        # Update instance fields with validated data
-        instance.name = validated_data.get('name', instance.name)
-        instance.email = validated_data.get('email', instance.email)
-        instance.is_active = validated_data.get('is_active', instance.is_active)
+        # Update only the fields present in the request (all of them for PUT,
+        # just the submitted ones for PATCH)
+        for field, value in validated_data.items():
+            setattr(instance, field, value)
         
-        # Save the updated instance to the database
-        instance.save()
+        # Save only those columns so the UPDATE doesn't rewrite the whole row
+        # A duplicate email is rejected by the unique index and becomes a 400
+        try:
+            with transaction.atomic():  # type: ignore
+                instance.save(update_fields=list(validated_data))
+        except IntegrityError as error:
+            raise_for_integrity_error(error)
         return instance
+    
+    def update_by_pk(self, pk):
+        """
+        Update the user with id `pk` without loading it first.
+        
+        Used by UserViewSet.update(): the serializer is validated without
+        an instance, then this writes the validated fields with a single
+        UPDATE ... RETURNING query. Afterwards `self.instance` is the
+        updated user, so `serializer.data` works as after save().
+        
+        Parameters:
+        -----------
+        pk : str
+            The user's id from the URL
+        
+        Returns:
+        --------
+        User: The updated user, or None if no user has this id
+        """
+        assert hasattr(self, '_validated_data'), (
+            'You must call `.is_valid()` before calling `.update_by_pk()`.'
+        )
+        
+        # A duplicate email is rejected by the unique index and becomes a 400
+        try:
+            with transaction.atomic():  # type: ignore
+                self.instance = User.objects.update_returning(pk, **self.validated_data)  # type: ignore
+        except IntegrityError as error:
+            raise_for_integrity_error(error)
+        return self.instance
 
 
-class UserListSerializer(serializers.ModelSerializer):
+class UserListSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Lightweight User Serializer for List Views
     ===========================================
     A simplified serializer for listing users.
     
     Since the User model is already simple (id, name, email),
-    this serializer is the same as UserSerializer.
+    this serializer matches UserSerializer plus a 'url' link to each
+    user's detail endpoint.
     You can customize this if you want to show fewer fields in list views.
     """
     
+    # Link to the user's detail endpoint (GET /api/users/{id}/)
+    # Built with an f-string rather than HyperlinkedIdentityField, which
+    # would call reverse() once per row on every list request.
+    # Must stay in sync with the 'user-detail' route in users/urls.py.
+    url = serializers.SerializerMethodField()
+    
     class Meta:
         model = User
-        # Include all fields (already minimal)
-        fields = '__all__'
+        # Only the columns the list view needs (see UserViewSet.list_fields
+        # and serialize_user_rows, which must produce the same output)
+        fields = ['id', 'url', 'name', 'email', 'is_active']
         read_only_fields = ['id']
+    
+    def get_url(self, obj):
+        """
+        Return the detail URL path for a user.
+        
+        Parameters:
+        -----------
+        obj : User
+            The user being serialized
+        
+        Returns:
+        --------
+        str: The user's detail URL path, e.g. "/api/users/1/"
+        """
+        return f"/api/users/{obj.id}/"
+
 
+class BulkSetActiveSerializer(serializers.Serializer):
+    """
+    Bulk Status Serializer
+    ======================
+    Validates the request body of POST /api/users/bulk_set_active/:
+    
+    {
+        "ids": [1, 2, 3],
+        "is_active": false
+    }
+    """
+    
+    # Ids of the users to update (at least one)
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        allow_empty=False,
+    )
+    
+    # The new active status for all of them
+    is_active = serializers.BooleanField()
+
+
+def serialize_user_rows(rows):
+    """
+    Serialize users fetched as value rows, without DRF field machinery.
+    
+    Fast path for the list endpoint: builds the same dicts as
+    UserListSerializer, but from plain (id, name, email, is_active) tuples
+    (QuerySet.values_list()), so no model instances, bound fields or
+    per-field to_representation() calls are needed. Keep the output in
+    sync with UserListSerializer.
+    
+    Parameters:
+    -----------
+    rows : iterable
+        (id, name, email, is_active) tuples
+    
+    Returns:
+    --------
+    list: One dict per user, e.g.
+        {"id": 1, "url": "/api/users/1/", "name": ..., "email": ..., "is_active": ...}
+    """
+    return [
+        {
+            'id': user_id,
+            'url': f"/api/users/{user_id}/",
+            'name': name,
+            'email': email,
+            'is_active': is_active,
+        }
+        for user_id, name, email, is_active in rows
+    ]
@@ -0,0 +1,30 @@
+"""
+User Signals
+============
+Signal handlers for the User model, connected in UsersConfig.ready().
+
+Django sends post_save/post_delete after User.save()/User.delete()
+(including saves from the admin). QuerySet.update() and bulk_create()
+don't send them; those call invalidate_user_caches() directly.
+"""
+
+from django.db import transaction  # type: ignore
+from django.db.models.signals import post_delete, post_save  # type: ignore
+from django.dispatch import receiver  # type: ignore
+
+from .cache import invalidate_user_caches
+from .models import User
+
+
+@receiver([post_save, post_delete], sender=User)
+def user_changed(sender, using=None, **kwargs):
+    """
+    Invalidate cached user responses whenever a user is saved or deleted.
+    
+    The signals fire before the change is committed when the write runs
+    in a transaction (as the admin's do). Bumping the version then would
+    let a concurrent request read the old rows and cache them under the
+    new version, so the invalidation waits for the commit (it runs right
+    away outside a transaction).
+    """
+    transaction.on_commit(invalidate_user_caches, using=using)
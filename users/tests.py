@@ -1,3 +1,175 @@
-from django.test import TestCase
+# DRF's test client and serializer __new__ aren't typed: pyright infers
+# requests (WSGIRequest) for client responses and ListSerializer for any
+# serializer instance
+# pyright: reportAttributeAccessIssue=false, reportArgumentType=false
 
-# Create your tests here.
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from .models import User
+from .serializers import UserListSerializer, serialize_user_rows
+
+# A per-process cache, so get_response_cache() caches nothing and every
+# request reads the database (a shared cache would outlive each test's
+# rolled-back writes)
+NO_RESPONSE_CACHE = {
+    'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+}
+
+
+class UserListUrlTests(SimpleTestCase):
+    """
+    The list serializers build detail URLs with an f-string instead of
+    reverse() for speed; make sure they still match the router's URL.
+    """
+    
+    def test_get_url_matches_reverse(self):
+        url = UserListSerializer().get_url(User(id=1))
+        self.assertEqual(url, reverse('user-detail', kwargs={'pk': 1}))
+    
+    def test_serialize_user_rows_url_matches_reverse(self):
+        rows = serialize_user_rows([(1, 'John Doe', 'john@example.com', True)])
+        self.assertEqual(rows[0]['url'], reverse('user-detail', kwargs={'pk': 1}))
+
+
+class UserManagerTests(TestCase):
+    """
+    The single-query writes in UserManager (hand-built SQL).
+    """
+    
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(name='John Doe', email='john@example.com')
+    
+    def test_update_returning_sets_updated_at(self):
+        user = User.objects.update_returning(self.user.pk, name='Johnny Doe')
+        self.assertEqual(user.name, 'Johnny Doe')
+        self.assertGreater(user.updated_at, self.user.updated_at)
+        
+        stored = User.objects.get(pk=self.user.pk)
+        self.assertEqual(stored.name, 'Johnny Doe')
+        self.assertEqual(stored.updated_at, user.updated_at)
+    
+    def test_update_returning_missing_or_invalid_id(self):
+        self.assertIsNone(User.objects.update_returning(self.user.pk + 1, name='X'))
+        self.assertIsNone(User.objects.update_returning('abc', name='X'))
+    
+    def test_delete_by_pk(self):
+        self.assertEqual(User.objects.delete_by_pk('abc'), 0)
+        self.assertEqual(User.objects.delete_by_pk(self.user.pk), 1)
+        self.assertEqual(User.objects.delete_by_pk(self.user.pk), 0)
+        self.assertFalse(User.objects.filter(pk=self.user.pk).exists())
+
+
+@override_settings(CACHES=NO_RESPONSE_CACHE)
+class UserDetailAPITests(APITestCase):
+    """
+    PUT, PATCH and DELETE on /api/users/{id}/.
+    """
+    
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(name='John Doe', email='john@example.com')
+        cls.other = User.objects.create(name='Jane Smith', email='jane@example.com')
+    
+    def detail_url(self, pk):
+        return reverse('user-detail', kwargs={'pk': pk})
+    
+    def test_put(self):
+        response = self.client.put(self.detail_url(self.user.pk), {
+            'name': 'John Doe Updated',
+            'email': 'John.Updated@Example.com',
+            'is_active': False,
+        }, format='json')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['email'], 'john.updated@example.com')
+        self.assertFalse(response.data['is_active'])
+        
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.name, 'John Doe Updated')
+    
+    def test_put_missing_field(self):
+        response = self.client.put(self.detail_url(self.user.pk), {
+            'name': 'John Doe Updated',
+        }, format='json')
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('email', response.data)
+    
+    def test_patch(self):
+        response = self.client.patch(self.detail_url(self.user.pk), {
+            'name': '  Johnny Doe ',
+        }, format='json')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['name'], 'Johnny Doe')
+        self.assertEqual(response.data['email'], 'john@example.com')
+    
+    def test_patch_duplicate_email(self):
+        response = self.client.patch(self.detail_url(self.user.pk), {
+            'email': 'JANE@example.com',
+        }, format='json')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data['email'], ["A user with this email already exists."])
+        
+        # The failed UPDATE must not break the request's transaction
+        self.assertEqual(User.objects.get(pk=self.user.pk).email, 'john@example.com')
+    
+    def test_update_missing_user(self):
+        missing = self.other.pk + 1
+        response = self.client.patch(self.detail_url(missing), {'name': 'X'}, format='json')
+        self.assertEqual(response.status_code, 404)
+        
+        response = self.client.put(self.detail_url('abc'), {
+            'name': 'X',
+            'email': 'x@example.com',
+        }, format='json')
+        self.assertEqual(response.status_code, 404)
+    
+    def test_delete(self):
+        response = self.client.delete(self.detail_url(self.user.pk))
+        self.assertEqual(response.status_code, 204)
+        self.assertFalse(User.objects.filter(pk=self.user.pk).exists())
+        
+        response = self.client.delete(self.detail_url(self.user.pk))
+        self.assertEqual(response.status_code, 404)
+
+
+@override_settings(CACHES=NO_RESPONSE_CACHE)
+class UserListPaginationTests(APITestCase):
+    """
+    Keyset ("?after=") next links on /api/users/.
+    """
+    
+    @classmethod
+    def setUpTestData(cls):
+        User.objects.bulk_create(
+            User(name=f'User {n}', email=f'user{n}@example.com') for n in range(12)
+        )
+        cls.ids = list(User.objects.values_list('id', flat=True))
+    
+    def test_next_link_uses_after(self):
+        response = self.client.get(reverse('user-list'))
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data['count'], 12)
+        self.assertEqual([user['id'] for user in data['results']], self.ids[:10])
+        self.assertTrue(data['next'].endswith(f'?after={self.ids[9]}'))
+        
+        response = self.client.get(data['next'])
+        data = response.json()
+        self.assertEqual(data['count'], 12)
+        self.assertEqual([user['id'] for user in data['results']], self.ids[10:])
+        self.assertIsNone(data['next'])
+        self.assertIsNone(data['previous'])
+    
+    def test_next_link_keeps_filters(self):
+        response = self.client.get(reverse('user-list'), {'search': 'user', 'page': 1})
+        next_link = response.json()['next']
+        self.assertIn('search=user', next_link)
+        self.assertIn(f'after={self.ids[9]}', next_link)
+        self.assertNotIn('page=', next_link)
+    
+    def test_invalid_cursor(self):
+        response = self.client.get(reverse('user-list'), {'after': 'abc'})
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(response.json()['detail'], 'Invalid cursor.')
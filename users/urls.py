@@ -26,8 +26,7 @@ Standard CRUD URLs:
 - DELETE /api/users/{id}/         -> delete user
 
 Custom Action URLs (from @action decorators):
-- POST   /api/users/{id}/activate/     -> activate user
-- POST   /api/users/{id}/deactivate/   -> deactivate user
+- POST   /api/users/bulk_set_active/   -> activate/deactivate many users
 - GET    /api/users/active_users/      -> get all active users
 """
 
@@ -51,21 +50,18 @@ router.register(r'users', UserViewSet, basename='user')
 #   - Name: 'user-list'
 #   - Methods: GET (list), POST (create)
 #
-# ^users/(?P<pk>[^/.]+)/$ 
-#   - Name: 'user-detail'
-#   - Methods: GET (retrieve), PUT (update), PATCH (partial_update), DELETE (destroy)
-#
-# ^users/(?P<pk>[^/.]+)/activate/$ 
-#   - Name: 'user-activate'
-#   - Methods: POST
-#
-# ^users/(?P<pk>[^/.]+)/deactivate/$ 
-#   - Name: 'user-deactivate'
+# ^users/bulk_set_active/$ 
+#   - Name: 'user-bulk-set-active'
 #   - Methods: POST
 #
 # ^users/active_users/$ 
 #   - Name: 'user-active-users'
 #   - Methods: GET
+#
+# ^users/(?P<pk>[^/.]+)/$ 
+#   - Name: 'user-detail'
+#   - Methods: GET (retrieve), PUT (update), PATCH (partial_update), DELETE (destroy)
+#   - PATCH {"is_active": true/false} activates/deactivates a user
 
 # URL patterns for this app
 urlpatterns = [
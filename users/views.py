@@ -18,12 +18,38 @@ API Workflow:
 4. View returns HTTP response (usually JSON)
 """
 
+import hashlib
+
+from django.db import transaction  # type: ignore
+from django.db.models import Count, Max, Q  # type: ignore
+from django.http import Http404, HttpResponse  # type: ignore
+from django.utils import timezone  # type: ignore
+from django.utils.cache import get_conditional_response, patch_cache_control  # type: ignore
+from django.utils.http import http_date  # type: ignore
 from rest_framework import viewsets, status  # type: ignore
 from rest_framework.decorators import action  # type: ignore
 from rest_framework.response import Response  # type: ignore
 
+from .cache import (
+    ACTIVE_USERS_CACHE_TIMEOUT,
+    get_response_cache,
+    USER_LIST_CACHE_TIMEOUT,
+    invalidate_user_caches,
+    user_cache_key,
+)
 from .models import User
-from .serializers import UserSerializer, UserListSerializer
+from .pagination import UserPagination
+from .renderers import ORJSONRenderer
+from .serializers import (
+    BulkSetActiveSerializer,
+    UserListSerializer,
+    UserSerializer,
+    serialize_user_rows,
+)
+
+
+# Values of ?is_active= that mean True (anything else means False)
+_TRUTHY = frozenset({'true', '1', 'yes', 't', 'y', 'on'})
 
 
 class UserViewSet(viewsets.ModelViewSet):
@@ -63,6 +89,38 @@ class UserViewSet(viewsets.ModelViewSet):
     # Default serializer class for this viewset
     serializer_class = UserSerializer
     
+    # Page number pagination with a cached COUNT(*)
+    pagination_class = UserPagination
+    
+    # Columns loaded for the list action - the ones UserListSerializer uses,
+    # in the order serialize_user_rows() expects them.
+    # Other actions load every column for UserSerializer.
+    list_fields = ('id', 'name', 'email', 'is_active')
+    
+    # Maximum number of ids per UPDATE in bulk_set_active
+    # (keeps each statement well below PostgreSQL's bind parameter limit)
+    bulk_batch_size = 10000
+    
+    # How long (seconds) clients may reuse a list or detail response
+    # before revalidating it with If-None-Match / If-Modified-Since
+    cache_max_age = 60
+    
+    # How long (seconds) the MAX(updated_at)/COUNT(id) behind a list ETag
+    # is reused (entries are also dropped whenever a user is written)
+    etag_cache_timeout = 30
+    
+    # How long (seconds) a user loaded by get_object() is reused
+    # (entries are also dropped whenever a user is written)
+    object_cache_timeout = 60
+    
+    # Relations to load with the users, to avoid one query per row (N+1)
+    # when a serializer reads them. User has no relations yet; add
+    # ForeignKey/OneToOne names to select_related_fields (joined into the
+    # same query) and many-to-many/reverse names to prefetch_related_fields
+    # (one extra query per relation) as serializers start using them.
+    select_related_fields: tuple[str, ...] = ()
+    prefetch_related_fields: tuple[str, ...] = ()
+    
     def get_queryset(self):
         """
         Get the queryset for this view.
@@ -72,16 +130,24 @@ class UserViewSet(viewsets.ModelViewSet):
         
         Returns:
         --------
-        QuerySet: Filtered and ordered queryset
+        QuerySet: Filtered queryset (ordered by id, see User.Meta.ordering)
         """
         queryset = User.objects.all()
         
+        # Load related objects up front (see select_related_fields)
+        # Skipped when empty: select_related() with no names follows
+        # every foreign key
+        if self.select_related_fields:
+            queryset = queryset.select_related(*self.select_related_fields)
+        if self.prefetch_related_fields:
+            queryset = queryset.prefetch_related(*self.prefetch_related_fields)
+        
         # Optional: Add filtering based on query parameters
         # Example: /api/users/?is_active=true
         is_active = self.request.query_params.get('is_active', None)
         if is_active is not None:
             # Convert string to boolean
-            is_active_bool = is_active.lower() in ['true', '1', 'yes']
+            is_active_bool = is_active.lower() in _TRUTHY
             queryset = queryset.filter(is_active=is_active_bool)
         
         # Optional: Add search functionality
@@ -89,14 +155,16 @@ class UserViewSet(viewsets.ModelViewSet):
         search = self.request.query_params.get('search', None)
         if search:
             # Search in name and email fields
+            # A single Q(...) | Q(...) keeps this one WHERE ... OR ... clause
+            # (combining two querysets with | duplicates the other filters)
+            # Each side is served by a trigram index on UPPER(column), so
+            # the planner can BitmapOr two index scans (see User.Meta)
             queryset = queryset.filter(
-                name__icontains=search
-            ) | queryset.filter(
-                email__icontains=search
+                Q(name__icontains=search) | Q(email__icontains=search)
             )
         
-        # Order by id
-        return queryset.order_by('id')
+        # Ordered by id via User.Meta.ordering
+        return queryset
     
     def get_serializer_class(self):
         """
@@ -113,6 +181,9 @@ class UserViewSet(viewsets.ModelViewSet):
         # Use lightweight serializer for list action
         if self.action == 'list':
             return UserListSerializer
+        # Request body serializer for the bulk status action
+        if self.action == 'bulk_set_active':
+            return BulkSetActiveSerializer
         # Use full serializer for all other actions
         return UserSerializer
     
@@ -127,6 +198,19 @@ class UserViewSet(viewsets.ModelViewSet):
         - is_active: Filter by active status (true/false)
         - search: Search in name and email fields
         - page: Page number for pagination
+        - after: Id of the last user on the previous page ("next" links)
+        
+        Caching:
+        --------
+        The response carries an ETag built from the query string, the
+        number of matching users and their latest updated_at. A request
+        with a matching If-None-Match header gets 304 Not Modified without
+        the users being loaded or serialized.
+        
+        With a shared cache (see users/cache.py), each page is also cached
+        (by full URL) for USER_LIST_CACHE_TIMEOUT seconds and invalidated
+        whenever a user is written, so repeated requests for the same page
+        don't query the database.
         
         Response:
         ---------
@@ -148,15 +232,145 @@ class UserViewSet(viewsets.ModelViewSet):
         # Get the filtered queryset
         queryset = self.get_queryset()
         
-        # Apply pagination
-        page = self.paginate_queryset(queryset)
-        if page is not None:
-            serializer = self.get_serializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
+        # Conditional GET: answer 304 if the client's copy is still current
+        stats = self.get_list_stats(queryset)
+        etag = self.get_list_etag(request, stats)
+        not_modified = get_conditional_response(request, etag=etag)
+        if not_modified is not None:
+            return self.set_cache_headers(not_modified, etag)
+        
+        # Serve the page from the cache if it hasn't changed
+        response_cache = get_response_cache()
+        key = user_cache_key('list', request.build_absolute_uri())
+        data = response_cache.get(key)
+        if data is None:
+            # Fetch only the listed columns as plain tuples and build the
+            # response dicts directly; the output matches UserListSerializer
+            # without creating model instances or running DRF fields per row
+            rows = queryset.values_list(*self.list_fields)
+            
+            # Apply pagination, reusing the ETag query's count instead of
+            # letting the paginator count the rows again
+            page = None
+            if self.paginator is not None:
+                page = self.paginator.paginate_queryset(
+                    rows, request, view=self, count=stats['count']
+                )
+            if page is not None:
+                data = self.get_paginated_response(serialize_user_rows(page)).data
+                response_cache.set(key, data, USER_LIST_CACHE_TIMEOUT)
+            else:
+                # If pagination is disabled, return all results, streaming
+                # rows from the database in chunks so the queryset doesn't
+                # also keep every row in its result cache alongside the dicts
+                data = serialize_user_rows(rows.iterator(chunk_size=2000))
+        
+        return self.set_cache_headers(self.render_list(request, data), etag)
+    
+    def render_list(self, request, data):
+        """
+        Build the response for list data, pre-rendered when it is JSON.
         
-        # If pagination is disabled, return all results
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data)
+        For JSON requests (nearly all of them) the data is encoded with
+        orjson straight into an HttpResponse, skipping the deferred
+        rendering of a DRF Response. Other formats (the browsable API in
+        development) still get a Response rendered by their renderer.
+        
+        Parameters:
+        -----------
+        request : Request
+            The current request (after content negotiation)
+        data : dict or list
+            The response data
+        
+        Returns:
+        --------
+        HttpResponse: The response (status 200)
+        """
+        renderer = request.accepted_renderer
+        if not isinstance(renderer, ORJSONRenderer):
+            return Response(data)
+        
+        # Same Content-Type as Response would set (JSON has no charset)
+        content = renderer.render(data, request.accepted_media_type, self.get_renderer_context())
+        return HttpResponse(content, content_type=renderer.media_type)
+    
+    def get_list_stats(self, queryset):
+        """
+        Return the number of listed users and their latest updated_at.
+        
+        Uses a single aggregate query (MAX(updated_at), COUNT(id)) over the
+        filtered queryset. The ETag is built from it, and list() hands the
+        count to the paginator, so the rows are only counted once.
+        
+        With a shared cache (see users/cache.py), the aggregate is cached
+        per query and invalidated with the other user caches, so a repeated
+        If-None-Match request is answered with 304 without touching the
+        database.
+        
+        Parameters:
+        -----------
+        queryset : QuerySet
+            The filtered queryset being listed
+        
+        Returns:
+        --------
+        dict: {"count": int, "last_modified": datetime or None}
+        """
+        queryset = queryset.order_by()
+        return get_response_cache().get_or_set(
+            user_cache_key('list-stats', str(queryset.query)),
+            lambda: queryset.aggregate(
+                last_modified=Max('updated_at'),
+                count=Count('id'),
+            ),
+            self.etag_cache_timeout,
+        )
+    
+    def get_list_etag(self, request, stats):
+        """
+        Build the ETag for a list response.
+        
+        Any create, update or delete of a matching user changes the count
+        or latest updated_at, and so the ETag. The full path is included so
+        each page, filter and search gets its own ETag.
+        
+        Parameters:
+        -----------
+        request : Request
+            The current request
+        stats : dict
+            The list's count and latest updated_at (see get_list_stats)
+        
+        Returns:
+        --------
+        str: A weak ETag, e.g. 'W/"3f2a..."'
+        """
+        key = f"{request.get_full_path()}|{stats['last_modified']}|{stats['count']}"
+        return f'W/"{hashlib.sha1(key.encode()).hexdigest()}"'
+    
+    def set_cache_headers(self, response, etag, last_modified=None):
+        """
+        Add the ETag, Last-Modified and Cache-Control headers to a response.
+        
+        Parameters:
+        -----------
+        response : HttpResponse
+            The response to update (200 or 304)
+        etag : str
+            The ETag of the returned data
+        last_modified : datetime, optional
+            When the returned data last changed (detail responses only)
+        
+        Returns:
+        --------
+        HttpResponse: The same response, with headers set
+        """
+        response['ETag'] = etag
+        if last_modified is not None:
+            response['Last-Modified'] = http_date(last_modified.timestamp())
+        patch_cache_control(response, max_age=self.cache_max_age, must_revalidate=True)
+        return response
     
     def create(self, request, *args, **kwargs):
         """
@@ -187,9 +401,16 @@ class UserViewSet(viewsets.ModelViewSet):
             "name": ["This field is required."],
             "email": ["This field is required."]
         }
+        
+        Batch Create:
+        -------------
+        Send a JSON list of user objects to create them all at once.
+        The response is the list of created users.
         """
         # Get serializer with request data
-        serializer = self.get_serializer(data=request.data)
+        # A list body creates several users in one bulk INSERT
+        many = isinstance(request.data, list)
+        serializer = self.get_serializer(data=request.data, many=many)
         
         # Validate the data
         # raise_exception=True will return 400 Bad Request if validation fails
@@ -220,6 +441,39 @@ class UserViewSet(viewsets.ModelViewSet):
         """
         serializer.save()
     
+    def get_object(self):
+        """
+        Return the user for a detail request (retrieve).
+        
+        Users are cached per id (and query string, since get_queryset()
+        filters on it), so repeated reads of the same user don't query the
+        database. Entries are invalidated with the other user caches
+        whenever a user is written. Only done with a shared cache (see
+        users/cache.py); otherwise every request loads the user.
+        
+        Returns:
+        --------
+        User: The requested user
+        
+        Raises:
+        -------
+        Http404: If no user has this id
+        """
+        key = user_cache_key(
+            'user',
+            str(self.kwargs[self.lookup_field]),
+            self.request.META.get('QUERY_STRING', ''),
+        )
+        response_cache = get_response_cache()
+        instance = response_cache.get(key)
+        if instance is None:
+            instance = super().get_object()
+            response_cache.set(key, instance, self.object_cache_timeout)
+        else:
+            # super().get_object() does this for freshly loaded users
+            self.check_object_permissions(self.request, instance)
+        return instance
+    
     def retrieve(self, request, *args, **kwargs):
         """
         Retrieve a specific user by ID.
@@ -240,15 +494,32 @@ class UserViewSet(viewsets.ModelViewSet):
         {
             "detail": "Not found."
         }
+        
+        Caching:
+        --------
+        The response carries an ETag (the user's id and updated_at) and a
+        Last-Modified header. A request with a matching If-None-Match (or
+        an If-Modified-Since that is not older) gets 304 Not Modified
+        without the user being serialized.
         """
         # Get the user instance
         instance = self.get_object()
         
+        # Conditional GET: answer 304 if the client's copy is still current
+        etag = f'W/"{instance.pk}-{instance.updated_at.timestamp()}"'
+        not_modified = get_conditional_response(
+            request,
+            etag=etag,
+            last_modified=int(instance.updated_at.timestamp()),
+        )
+        if not_modified is not None:
+            return self.set_cache_headers(not_modified, etag, instance.updated_at)
+        
         # Serialize the user
         serializer = self.get_serializer(instance)
         
         # Return the serialized data
-        return Response(serializer.data)
+        return self.set_cache_headers(Response(serializer.data), etag, instance.updated_at)
     
     def update(self, request, *args, **kwargs):
         """
@@ -275,15 +546,18 @@ class UserViewSet(viewsets.ModelViewSet):
         
         400 Bad Request: Validation error
         404 Not Found: User doesn't exist
+        
+        The user isn't loaded before the update: the data is validated on
+        its own (nothing in UserSerializer's validation needs the current
+        user), then written and read back with one UPDATE ... RETURNING.
+        Because of that, invalid data for an id that doesn't exist gets
+        400 rather than 404 (see perform_update for permissions).
         """
         # partial=False means all fields are required (PUT)
         partial = kwargs.pop('partial', False)
         
-        # Get the user instance
-        instance = self.get_object()
-        
-        # Get serializer with instance and new data
-        serializer = self.get_serializer(instance, data=request.data, partial=partial)
+        # Get serializer with the new data (no instance - see above)
+        serializer = self.get_serializer(data=request.data, partial=partial)
         
         # Validate the data
         serializer.is_valid(raise_exception=True)
@@ -314,10 +588,18 @@ class UserViewSet(viewsets.ModelViewSet):
             "name": "Johnny Doe",  // updated
             "email": "john@example.com"  // unchanged
         }
+        
+        Activate/Deactivate:
+        --------------------
+        Send only {"is_active": true} or {"is_active": false}.
+        (Use bulk_set_active to change many users at once.)
         """
         # partial=True means only provided fields are required (PATCH)
-        kwargs['partial'] = True
-        return self.update(request, *args, **kwargs)
+        # (same steps as update(), without re-dispatching through it)
+        serializer = self.get_serializer(data=request.data, partial=True)
+        serializer.is_valid(raise_exception=True)
+        self.perform_update(serializer)
+        return Response(serializer.data)
     
     def perform_update(self, serializer):
         """
@@ -325,12 +607,25 @@ class UserViewSet(viewsets.ModelViewSet):
         
         Override this method to add custom logic before saving.
         
+        Note: there is no get_object() call here, so
+        check_object_permissions() is never run. That is fine while
+        permission_classes has no object-level checks; if one is added,
+        load the user with self.get_object() first.
+        
         Parameters:
         -----------
         serializer : Serializer
-            The validated serializer instance
+            The validated serializer instance (without an instance)
+        
+        Raises:
+        -------
+        Http404: If no user has the id from the URL
         """
-        serializer.save()
+        if serializer.update_by_pk(self.kwargs[self.lookup_field]) is None:
+            raise Http404
+        
+        # update_by_pk() doesn't send post_save, so drop cached responses here
+        invalidate_user_caches()
     
     def destroy(self, request, *args, **kwargs):
         """
@@ -342,12 +637,24 @@ class UserViewSet(viewsets.ModelViewSet):
         ---------
         204 No Content: User deleted successfully
         404 Not Found: User doesn't exist
+        
+        The user isn't loaded first: a single DELETE removes it, and no
+        matching row means 404. So perform_destroy() isn't called (it needs
+        the loaded instance); to change how users are deleted (e.g. a soft
+        delete), override this method.
+        
+        Note: like perform_update(), this skips get_object(), so
+        check_object_permissions() is never run. If permission_classes
+        gains object-level checks, go back to self.get_object() and
+        self.perform_destroy(instance).
         """
-        # Get the user instance
-        instance = self.get_object()
+        # Hard delete with one DELETE (no SELECT, deletion collector or
+        # transaction)
+        if not User.objects.delete_by_pk(self.kwargs[self.lookup_field]):
+            raise Http404
         
-        # Delete the user
-        self.perform_destroy(instance)
+        # delete_by_pk() doesn't send post_delete, so drop cached responses here
+        invalidate_user_caches()
         
         # Return success response with no content
         return Response(status=status.HTTP_204_NO_CONTENT)
@@ -371,66 +678,58 @@ class UserViewSet(viewsets.ModelViewSet):
         # instance.is_active = False
         # instance.save()
     
-    @action(detail=True, methods=['post'])
-    def activate(self, request, pk=None):
+    @action(detail=False, methods=['post'])
+    def bulk_set_active(self, request, format=None):
         """
-        Custom action to activate a user.
+        Custom action to activate or deactivate many users at once.
         
-        Endpoint: POST /api/users/{id}/activate/
+        Endpoint: POST /api/users/bulk_set_active/
         
-        This is a custom action (not part of standard CRUD).
-        @action decorator creates a new endpoint.
+        Replaces one PATCH {"is_active": ...} request (and one UPDATE) per
+        user with a single UPDATE ... WHERE id IN (...).
         
-        Parameters:
-        -----------
-        detail=True: This action is for a single user (requires pk)
-        methods=['post']: Only POST method is allowed
+        Request Body:
+        -------------
+        {
+            "ids": [1, 2, 3],
+            "is_active": false
+        }
         
         Response:
         ---------
-        200 OK: User activated
+        200 OK: Number of users updated (unknown ids are ignored)
         {
-            "status": "User activated successfully",
-            "user": { ... user data ... }
+            "updated": 3
         }
-        """
-        user = self.get_object()
-        user.is_active = True
-        user.save()
         
-        serializer = self.get_serializer(user)
-        return Response({
-            'status': 'User activated successfully',
-            'user': serializer.data
-        })
-    
-    @action(detail=True, methods=['post'])
-    def deactivate(self, request, pk=None):
+        400 Bad Request: Validation error
         """
-        Custom action to deactivate a user.
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
         
-        Endpoint: POST /api/users/{id}/deactivate/
+        ids = serializer.validated_data['ids']
+        is_active = serializer.validated_data['is_active']
         
-        Response:
-        ---------
-        200 OK: User deactivated
-        {
-            "status": "User deactivated successfully",
-            "user": { ... user data ... }
-        }
-        """
-        user = self.get_object()
-        user.is_active = False
-        user.save()
+        # QuerySet.update() skips auto_now, so set updated_at explicitly
+        now = timezone.now()
+        updated = 0
         
-        serializer = self.get_serializer(user)
-        return Response({
-            'status': 'User deactivated successfully',
-            'user': serializer.data
-        })
+        # One UPDATE per batch of ids, all in one transaction
+        with transaction.atomic():
+            for start in range(0, len(ids), self.bulk_batch_size):
+                batch = ids[start:start + self.bulk_batch_size]
+                updated += User.objects.filter(id__in=batch).update(
+                    is_active=is_active,
+                    updated_at=now,
+                )
+        
+        # update() doesn't send post_save, so drop cached responses here
+        invalidate_user_caches()
+        
+        return Response({'updated': updated})
     
     @action(detail=False, methods=['get'])
-    def active_users(self, request):
+    def active_users(self, request, format=None):
         """
         Custom action to get all active users.
         
@@ -443,13 +742,39 @@ class UserViewSet(viewsets.ModelViewSet):
         
         Response:
         ---------
-        200 OK: List of active users
-        [
-            { ... user data ... },
-            { ... user data ... },
-            ...
-        ]
-        """
-        active_users = User.objects.filter(is_active=True)
-        serializer = self.get_serializer(active_users, many=True)
-        return Response(serializer.data)
+        200 OK: List of active users, paginated like list()
+        {
+            "count": 2,
+            "next": null,
+            "previous": null,
+            "results": [
+                { ... user data ... },
+                { ... user data ... }
+            ]
+        }
+        
+        Each page is cached for ACTIVE_USERS_CACHE_TIMEOUT seconds and
+        invalidated whenever a user is written (only with a shared cache,
+        see users/cache.py).
+        """
+        key = user_cache_key('active', request.build_absolute_uri())
+        response_cache = get_response_cache()
+        data = response_cache.get(key)
+        if data is None:
+            queryset = User.objects.filter(is_active=True)
+            
+            # Only one page of users is loaded and serialized per request
+            page = self.paginate_queryset(queryset)
+            if page is not None:
+                serializer = self.get_serializer(page, many=True)
+                data = self.get_paginated_response(serializer.data).data
+            else:
+                # If pagination is disabled, stream rows from the database
+                # in chunks instead of caching every instance in the queryset
+                serializer = self.get_serializer(
+                    queryset.iterator(chunk_size=2000), many=True
+                )
+                data = serializer.data
+            
+            response_cache.set(key, data, ACTIVE_USERS_CACHE_TIMEOUT)
+        return Response(data)